@@ -4,7 +4,13 @@ Parquet Visualizer - Main Streamlit Application
 A web-based application for inspecting and visualizing Parquet files locally.
 """
 
+import os
+import html
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 import streamlit as st
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from src.parquet_service import ParquetService
@@ -24,20 +30,55 @@ st.set_page_config(
 import streamlit.web.server.server as server
 server.MAX_UPLOAD_SIZE_MB = 2048
 
+# Most Parquet files kept open at once, by the service and by the cache below
+MAX_OPEN_FILES = 32
+
 # Initialize services
 @st.cache_resource
 def get_services():
-    return ParquetService(), ImageService()
+    return ParquetService(max_open_files=MAX_OPEN_FILES), ImageService()
 
 parquet_service, image_service = get_services()
 
+# Uploaded files are copied into one private temp directory per server
+@st.cache_resource
+def get_upload_dir():
+    return tempfile.mkdtemp(prefix="parquet_visualizer_")
+
+# Parsed files are reused across reruns until the file changes on disk
+@st.cache_resource(show_spinner=False, max_entries=MAX_OPEN_FILES)
+def load_parquet_file(file_path, mtime_ns):
+    return parquet_service.parse_file(file_path)
+
+# Column statistics are computed once per (file version, column)
+@st.cache_data(show_spinner=False)
+def get_cached_column_stats(file_path, mtime_ns, column_name):
+    parquet_file, _ = load_parquet_file(file_path, mtime_ns)
+    return parquet_service.get_column_stats(parquet_file, column_name)
+
+# Sorted pages of the whole file decode most of it, so larger files sort
+# the sample instead
+FULL_SORT_MAX_ROWS = 1_000_000
+
+# Largest gallery tile width (2 columns in wide layout)
+GALLERY_THUMBNAIL_SIZE = 600
+
+# Image decoding releases the GIL, so gallery tiles are decoded in parallel
+@st.cache_resource
+def get_decode_executor():
+    return ThreadPoolExecutor(max_workers=os.cpu_count())
+
 # Initialize session state
 if 'current_file' not in st.session_state:
     st.session_state.current_file = None
+if 'file_mtime_ns' not in st.session_state:
+    st.session_state.file_mtime_ns = None
 if 'file_metadata' not in st.session_state:
     st.session_state.file_metadata = None
 if 'parquet_file' not in st.session_state:
     st.session_state.parquet_file = None
+if 'uploaded_file_id' not in st.session_state:
+    st.session_state.uploaded_file_id = None
 if 'search_term' not in st.session_state:
     st.session_state.search_term = ""
 if 'use_sample' not in st.session_state:
@@ -45,6 +86,48 @@ if 'use_sample' not in st.session_state:
 if 'sample_data' not in st.session_state:
     st.session_state.sample_data = None
 
+# Elementwise type tests over object arrays, evaluated in one ufunc pass
+_is_dict = np.frompyfunc(lambda x: isinstance(x, dict), 1, 1)
+_is_binary = np.frompyfunc(lambda x: isinstance(x, (bytes, bytearray)), 1, 1)
+
+def _vectorized_image_label(series):
+    """Replace dict/binary cells with short text labels, keeping other values"""
+    values = series.to_numpy(dtype=object)
+    is_dict = _is_dict(values).astype(bool)
+    is_binary = _is_binary(values).astype(bool)
+    
+    labels = values.copy()
+    labels[is_dict] = [f"<dict: {{{', '.join(x.keys())}}}>" for x in values[is_dict]]
+    labels[is_binary] = [f"<binary: {len(x)} bytes>" for x in values[is_binary]]
+    return pd.Series(labels, index=series.index, name=series.name)
+
+def _fmt_dict(value):
+    return f"<dict: {{{', '.join(value.keys())}}}>"
+
+def _fmt_binary(value):
+    return f"<binary: {len(value)} bytes>"
+
+def _fmt_longstr(value):
+    # Truncate long values
+    return value[:47] + "..." if len(value) > 50 else value
+
+# Cell formatter by value type, for columns that need one
+_CELL_FORMATTERS = {
+    dict: _fmt_dict,
+    bytes: _fmt_binary,
+    bytearray: _fmt_binary,
+    str: _fmt_longstr,
+}
+
+def _pick_formatter(series):
+    """Pick one cell formatter for a column from its dtype and first value"""
+    if series.dtype != object and not pd.api.types.is_string_dtype(series.dtype):
+        return None
+    non_null = series.dropna()
+    if len(non_null) == 0:
+        return None
+    return _CELL_FORMATTERS.get(type(non_null.iloc[0]))
+
 def show_custom_table_with_images(df, selected_image_col):
     """Display a custom table with inline image rendering"""
     
@@ -54,77 +137,36 @@ def show_custom_table_with_images(df, selected_image_col):
     # Settings
     thumbnail_size = st.selectbox("Image size", [50, 100, 150, 200], index=1, key="preview_thumbnail_size")
     
-    st.divider()
+    def to_data_url(image_data):
+        # Image may be a dictionary with "bytes" key or direct bytes
+        image_bytes = image_service.extract_bytes(image_data)
+        if image_bytes is None:
+            return None
+        webp_bytes = image_service.thumbnail_webp_bytes(image_bytes, thumbnail_size)
+        return image_service.bytes_to_data_url(webp_bytes, "image/webp") if webp_bytes else None
+    
+    # Build the whole table up front so it is sent to the browser in one message
+    table = df[non_image_cols].copy()
+    formatters = [(col, _pick_formatter(df[col])) for col in non_image_cols]
+    for col, fmt in formatters:
+        if fmt is not None:
+            table[col] = table[col].map(fmt, na_action="ignore")
+    images = df[selected_image_col].map(to_data_url)
+    table.insert(0, selected_image_col, images)
+    
+    missing = int(images.isna().sum())
+    if missing:
+        st.warning(f"⚠️ {missing} of {len(images)} rows have no displayable image")
     
-    # Display each row
-    for idx in range(len(df)):
-        row = df.iloc[idx]
-        
-        # Create columns: image + data
-        col_img, col_data = st.columns([1, 3])
-        
-        with col_img:
-            # Display image
-            try:
-                image_data = row[selected_image_col]
-                
-                # Handle different data formats
-                image_bytes = None
-                
-                if image_data is None:
-                    st.info("No image")
-                elif isinstance(image_data, dict):
-                    # Image is a dictionary with "bytes" key
-                    if "bytes" in image_data:
-                        image_bytes = image_data["bytes"]
-                    else:
-                        st.warning(f"⚠️ Dict without 'bytes' key: {list(image_data.keys())}")
-                elif isinstance(image_data, str):
-                    # If it's a string representation, skip it
-                    st.warning("⚠️ Data converted to string")
-                elif isinstance(image_data, (bytes, bytearray)):
-                    # Direct bytes
-                    image_bytes = image_data
-                else:
-                    st.warning(f"⚠️ Unexpected type: {type(image_data).__name__}")
-                
-                # Extract and display image if we have bytes
-                if image_bytes is not None:
-                    if isinstance(image_bytes, (bytes, bytearray)) and len(image_bytes) > 0:
-                        image = image_service.extract_image(bytes(image_bytes))
-                        if image:
-                            st.image(image, width=thumbnail_size, caption=f"Row {idx}")
-                        else:
-                            st.warning("⚠️ Invalid image")
-                    else:
-                        st.info("Empty data")
-                        
-            except Exception as e:
-                st.error(f"Error: {str(e)[:50]}")
-                import traceback
-                with st.expander("Show details"):
-                    st.code(traceback.format_exc())
-        
-        with col_data:
-            # Display row data as a compact table
-            row_data = {}
-            for col in non_image_cols:
-                value = row[col]
-                # Truncate long values
-                if isinstance(value, dict):
-                    row_data[col] = f"<dict: {{{', '.join(value.keys())}}}>"
-                elif isinstance(value, (bytes, bytearray)):
-                    row_data[col] = f"<binary: {len(value)} bytes>"
-                elif isinstance(value, str) and len(value) > 50:
-                    row_data[col] = value[:47] + "..."
-                else:
-                    row_data[col] = value
-            
-            # Display as a small dataframe
-            row_df = pd.DataFrame([row_data])
-            st.dataframe(row_df, use_container_width=True, hide_index=True)
-        
-        st.divider()
+    st.dataframe(
+        table,
+        use_container_width=True,
+        hide_index=False,
+        row_height=thumbnail_size,
+        column_config={
+            selected_image_col: st.column_config.ImageColumn(selected_image_col, width="medium")
+        }
+    )
 
 
 
@@ -156,10 +198,24 @@ def main():
             )
             
             if uploaded_file is not None:
-                # Save uploaded file temporarily
-                temp_path = Path(f"/tmp/{uploaded_file.name}")
-                with open(temp_path, "wb") as f:
-                    f.write(uploaded_file.getbuffer())
+                # Save uploaded file temporarily (once per upload, in 4MB chunks)
+                temp_path = Path(get_upload_dir()) / uploaded_file.name
+                if st.session_state.uploaded_file_id != uploaded_file.file_id:
+                    uploaded_file.seek(0)
+                    # Write aside and swap in, so readers that memory-mapped a
+                    # previous file of the same name keep their own copy
+                    fd, partial_path = tempfile.mkstemp(dir=get_upload_dir(), suffix=".part")
+                    try:
+                        with os.fdopen(fd, "wb") as f:
+                            shutil.copyfileobj(uploaded_file, f, length=4 * 1024 * 1024)
+                        os.replace(partial_path, temp_path)
+                    except BaseException:
+                        # Also on a rerun interrupting the copy; don't leave .part files behind
+                        os.unlink(partial_path)
+                        raise
+                    st.session_state.uploaded_file_id = uploaded_file.file_id
+                    # Same name may hold new content; make sure it gets parsed
+                    st.session_state.current_file = None
                 file_to_load = str(temp_path)
         else:
             # Local file browser
@@ -180,8 +236,10 @@ def main():
         if file_to_load and st.session_state.current_file != file_to_load:
             try:
                 with st.spinner("Parsing Parquet file..."):
-                    parquet_file, metadata = parquet_service.parse_file(file_to_load)
+                    mtime_ns = os.stat(file_to_load).st_mtime_ns
+                    parquet_file, metadata = load_parquet_file(file_to_load, mtime_ns)
                     st.session_state.current_file = file_to_load
+                    st.session_state.file_mtime_ns = mtime_ns
                     st.session_state.file_metadata = metadata
                     st.session_state.parquet_file = parquet_file
                     # Reset sample data when loading new file
@@ -253,13 +311,14 @@ def main():
         show_statistics_view()
 
 
+@st.fragment
 def show_image_gallery():
     """Show image gallery view for image columns"""
     
     st.header("Image Gallery")
     
     # Get all columns (let user choose any column)
-    all_columns = [col.name for col in st.session_state.file_metadata.schema]
+    all_columns = st.session_state.file_metadata.column_names
     
     # Column selector - let user choose which column contains images
     selected_column = st.selectbox(
@@ -280,21 +339,22 @@ def show_image_gallery():
     
     # Load data
     try:
-        # Use sample if active, otherwise load page
+        # Use sample if active, otherwise load the image column of the first rows;
+        # both are Arrow tables, so only the current page is turned into Python
         if st.session_state.use_sample and st.session_state.sample_data is not None:
-            df = st.session_state.sample_data
-            total_images = len(df)
+            source = st.session_state.sample_data
         else:
-            # Load a page of data
             total_rows = st.session_state.file_metadata.row_count
             max_images = min(total_rows, 1000)  # Limit to 1000 images for performance
             
-            df = parquet_service.get_rows(
+            source = parquet_service.get_rows_arrow(
                 st.session_state.parquet_file,
                 offset=0,
-                limit=max_images
+                limit=max_images,
+                columns=[selected_column]
             )
-            total_images = len(df)
+        image_column = source.column(selected_column)
+        total_images = len(image_column)
         
         with col3:
             st.metric("Total Images", total_images)
@@ -306,73 +366,72 @@ def show_image_gallery():
         # Get images for current page
         start_idx = page * images_per_page
         end_idx = min(start_idx + images_per_page, total_images)
-        page_df = df.iloc[start_idx:end_idx].reset_index(drop=False)
+        page_images = image_column.slice(start_idx, end_idx - start_idx).to_pylist()
+        page_row_numbers = range(start_idx, end_idx)
         
         st.divider()
         
-        # Display images in grid
-        if len(page_df) > 0:
-            # Create grid
-            rows = (len(page_df) + columns_per_row - 1) // columns_per_row
+        # Decode and encode WEBP thumbnails for the page in parallel before rendering
+        executor = get_decode_executor()
+        decode_futures = {}
+        page_bytes = [image_service.extract_bytes(image_data) for image_data in page_images]
+        for img_idx, image_bytes in enumerate(page_bytes):
+            if image_bytes is not None:
+                decode_futures[img_idx] = executor.submit(
+                    image_service.get_thumbnail, image_bytes, GALLERY_THUMBNAIL_SIZE
+                )
+        
+        # Warm the thumbnail cache with the next page while this one is viewed
+        next_end_idx = min(end_idx + images_per_page, total_images)
+        next_images = image_column.slice(end_idx, next_end_idx - end_idx).to_pylist()
+        for image_data in next_images:
+            image_bytes = image_service.extract_bytes(image_data)
+            if image_bytes is not None:
+                executor.submit(image_service.thumbnail_webp_bytes, image_bytes, GALLERY_THUMBNAIL_SIZE)
+        
+        # Display images as one HTML grid instead of a widget per tile
+        if page_images:
+            show_info = st.checkbox("Show image info", key="gallery_show_info")
             
-            for row in range(rows):
-                cols = st.columns(columns_per_row)
+            tiles = []
+            for img_idx, image_data in enumerate(page_images):
+                image_bytes = page_bytes[img_idx]
+                caption = f"Row {page_row_numbers[img_idx]}"
+                
+                if image_data is None:
+                    body = '<div style="padding:1em 0">No image</div>'
+                elif image_bytes is None:
+                    type_name = html.escape(type(image_data).__name__)
+                    body = f'<div style="padding:1em 0">⚠️ No image data ({type_name})</div>'
+                else:
+                    # A failing tile gets a placeholder instead of breaking the grid
+                    try:
+                        thumbnail = decode_futures[img_idx].result()
+                    except Exception as e:
+                        print(f"Error decoding gallery image: {e}")
+                        thumbnail = None
+                    if thumbnail is not None:
+                        data_url = image_service.bytes_to_data_url(thumbnail.webp_bytes, "image/webp")
+                        body = f'<img src="{data_url}" style="width:100%">'
+                        if show_info:
+                            width, height = thumbnail.original_size
+                            caption += (
+                                f"<br>{thumbnail.format or 'Unknown'} · {width}×{height} · "
+                                f"{thumbnail.mode} · {len(image_bytes):,} bytes"
+                            )
+                    else:
+                        body = '<div style="padding:1em 0">⚠️ Could not decode</div>'
                 
-                for col_idx in range(columns_per_row):
-                    img_idx = row * columns_per_row + col_idx
-                    
-                    if img_idx < len(page_df):
-                        with cols[col_idx]:
-                            try:
-                                image_data = page_df.iloc[img_idx][selected_column]
-                                original_index = page_df.iloc[img_idx].get('index', start_idx + img_idx)
-                                
-                                # Handle different data formats
-                                image_bytes = None
-                                data_size = 0
-                                
-                                if image_data is None:
-                                    st.info("No image")
-                                elif isinstance(image_data, dict):
-                                    # Image is a dictionary with "bytes" key
-                                    if "bytes" in image_data:
-                                        image_bytes = image_data["bytes"]
-                                        data_size = len(image_bytes) if image_bytes else 0
-                                    else:
-                                        st.warning(f"⚠️ Dict without 'bytes' key")
-                                elif isinstance(image_data, str):
-                                    st.warning("⚠️ String data")
-                                elif isinstance(image_data, (bytes, bytearray)):
-                                    # Direct bytes
-                                    image_bytes = image_data
-                                    data_size = len(image_bytes)
-                                else:
-                                    st.warning(f"⚠️ Type: {type(image_data).__name__}")
-                                
-                                # Extract and display image if we have bytes
-                                if image_bytes is not None and isinstance(image_bytes, (bytes, bytearray)) and len(image_bytes) > 0:
-                                    image = image_service.extract_image(bytes(image_bytes))
-                                    
-                                    if image:
-                                        st.image(
-                                            image,
-                                            caption=f"Row {original_index}",
-                                            use_container_width=True
-                                        )
-                                        
-                                        # Show image info in expander
-                                        with st.expander("ℹ️ Info"):
-                                            st.text(f"Format: {image.format or 'Unknown'}")
-                                            st.text(f"Size: {image.width} x {image.height}")
-                                            st.text(f"Mode: {image.mode}")
-                                            st.text(f"Data size: {data_size} bytes")
-                                    else:
-                                        st.warning("⚠️ Could not decode")
-                                    
-                            except Exception as e:
-                                st.error(f"Error: {str(e)[:50]}")
-                                with st.expander("Show details"):
-                                    st.code(traceback.format_exc())
+                tiles.append(
+                    f'<figure style="margin:0">{body}'
+                    f'<figcaption style="text-align:center;font-size:0.8em;opacity:0.7">{caption}</figcaption>'
+                    f'</figure>'
+                )
+            
+            st.html(
+                f'<div style="display:grid;grid-template-columns:repeat({columns_per_row},1fr);gap:8px">'
+                f'{"".join(tiles)}</div>'
+            )
         else:
             st.info("No images to display on this page")
             
@@ -381,6 +440,7 @@ def show_image_gallery():
         st.code(traceback.format_exc())
 
 
+@st.fragment
 def show_data_view():
     """Show the main data table view"""
     
@@ -405,7 +465,7 @@ def show_data_view():
     with col2:
         if st.button("Clear Search", use_container_width=True):
             st.session_state.search_term = ""
-            st.rerun()
+            st.rerun(scope="fragment")
     
     # Pagination controls
     col1, col2, col3 = st.columns([1, 2, 1])
@@ -413,17 +473,23 @@ def show_data_view():
     with col1:
         page_size = st.selectbox("Rows per page", [50, 100, 200, 500], index=1, key="data_view_page_size")
     
-    # Use sample data if sampling is active
-    if st.session_state.use_sample:
+    # Use sample data if sampling is active, or to sort a large file
+    sort_selected = st.session_state.get("data_view_sort_column", "None") != "None"
+    sort_sample_only = (
+        not st.session_state.use_sample and sort_selected and not st.session_state.search_term
+        and st.session_state.file_metadata.row_count > FULL_SORT_MAX_ROWS
+    )
+    use_sample_rows = st.session_state.use_sample or sort_sample_only
+    if use_sample_rows:
         # Load sample data if not already loaded
         if st.session_state.sample_data is None:
             with st.spinner("Loading sample data..."):
-                st.session_state.sample_data = parquet_service.get_sample_rows(
+                st.session_state.sample_data = parquet_service.get_sample_table(
                     st.session_state.parquet_file,
                     sample_size=10000
                 )
         
-        total_rows = len(st.session_state.sample_data)
+        total_rows = st.session_state.sample_data.num_rows
         display_data = st.session_state.sample_data
     else:
         total_rows = st.session_state.file_metadata.row_count
@@ -431,10 +497,10 @@ def show_data_view():
     
     with col2:
         max_page = max(0, (total_rows - 1) // page_size)
-        page = st.slider("Page", 0, max_page, 0)
+        page = st.slider("Page", 0, max_page, 0, key="data_view_page")
     
     with col3:
-        if st.session_state.use_sample:
+        if use_sample_rows:
             st.metric("Sample Rows", f"{total_rows:,}")
         else:
             st.metric("Total Rows", f"{total_rows:,}")
@@ -444,41 +510,51 @@ def show_data_view():
     with col1:
         sort_column = st.selectbox(
             "Sort by",
-            ["None"] + [col.name for col in st.session_state.file_metadata.schema],
+            ["None"] + st.session_state.file_metadata.column_names,
             key="data_view_sort_column"
         )
     with col2:
-        sort_direction = st.radio("Direction", ["Ascending", "Descending"], horizontal=True)
+        sort_direction = st.radio("Direction", ["Ascending", "Descending"], horizontal=True, key="data_view_sort_direction")
+    if sort_sample_only:
+        st.info(
+            f"📊 Files over {FULL_SORT_MAX_ROWS:,} rows are sorted on a random sample of "
+            f"10,000 rows. Sort by 'None' to page through all rows."
+        )
+    
+    # Only the shown columns are read, so large binary columns can be left out
+    all_columns = st.session_state.file_metadata.column_names
+    hidden_columns = st.multiselect("Hide columns", all_columns, key="data_view_hidden_columns")
+    visible_columns = [col for col in all_columns if col not in hidden_columns] or all_columns
     
     # Load and display data
     try:
         offset = page * page_size
         
-        if st.session_state.use_sample:
-            # Use pre-loaded sample data
-            df = display_data
+        if use_sample_rows:
+            # Use pre-loaded sample data (kept as an Arrow table)
+            table = display_data
             
             # Apply sorting if requested
-            if sort_column != "None" and sort_column in df.columns:
-                df = df.sort_values(by=sort_column, ascending=(sort_direction == "Ascending"))
+            if sort_column != "None" and sort_column in table.column_names:
+                table = parquet_service.sort_sample(
+                    table, sort_column, sort_ascending=(sort_direction == "Ascending")
+                )
+            table = table.select(visible_columns)
             
             # Apply search if present
             if st.session_state.search_term:
-                search_lower = st.session_state.search_term.lower()
-                mask = df.astype(str).apply(
-                    lambda col: col.str.lower().str.contains(search_lower, na=False)
-                ).any(axis=1)
-                df = df[mask]
-                st.info(f"🔍 Found {len(df)} matching rows in sample")
+                table = parquet_service.search_sample(table, st.session_state.search_term)
+                st.info(f"🔍 Found {table.num_rows} matching rows in sample")
             
-            # Apply pagination
-            df = df.iloc[offset:offset + page_size]
+            # Apply pagination, converting only the visible page to pandas
+            df = parquet_service.slice_sample(table, offset, page_size)
         else:
             # Apply search if present
             if st.session_state.search_term:
                 df = parquet_service.search_rows(
                     st.session_state.parquet_file,
-                    st.session_state.search_term
+                    st.session_state.search_term,
+                    columns=visible_columns
                 )
                 st.info(f"🔍 Found {len(df)} matching rows")
                 # Apply pagination to search results
@@ -490,25 +566,17 @@ def show_data_view():
                     offset=offset,
                     limit=page_size,
                     sort_column=None if sort_column == "None" else sort_column,
-                    sort_ascending=(sort_direction == "Ascending")
+                    sort_ascending=(sort_direction == "Ascending"),
+                    columns=visible_columns
                 )
         
-        # Get all columns for user selection
-        all_columns = [col.name for col in st.session_state.file_metadata.schema]
-        
-        # Store original dataframe with bytes intact for image visualization
-        df_original = df.copy()
-        
         # Create display version with text representation for binary/dict columns
-        df_display = df.copy()
-        for col in df_display.columns:
-            df_display[col] = df_display[col].apply(
-                lambda x: (
-                    f"<dict: {{{', '.join(x.keys())}}}>" if isinstance(x, dict) else
-                    f"<binary: {len(x)} bytes>" if isinstance(x, (bytes, bytearray)) else
-                    x
-                )
-            )
+        # (only object columns can hold dicts or bytes). df itself keeps the
+        # bytes intact for image visualization; other columns are shared, not copied
+        df_display = df.copy(deep=False)
+        for col in df.columns:
+            if df[col].dtype == object:
+                df_display[col] = _vectorized_image_label(df[col])
         
         # Always show the table first with option to preview images
         col1, col2 = st.columns([3, 1])
@@ -533,13 +601,13 @@ def show_data_view():
             # Let user select which column to preview as images
             selected_image_col = st.selectbox(
                 "Select column to display as images",
-                all_columns,
+                list(df.columns),
                 help="Choose any column that contains image data (bytes or dict with 'bytes' key)",
                 key="data_view_image_column"
             )
             
             if selected_image_col:
-                show_custom_table_with_images(df_original, selected_image_col)
+                show_custom_table_with_images(df, selected_image_col)
             
     except Exception as e:
         st.error(f"Error loading data: {str(e)}")
@@ -553,17 +621,14 @@ def show_schema_view():
     
     metadata = st.session_state.file_metadata
     
-    # Create schema dataframe
-    schema_data = []
-    for col in metadata.schema:
-        schema_data.append({
-            "Column Name": col.name,
-            "Data Type": col.type,
-            "Nullable": "✓" if col.nullable else "✗",
-            "Image Column": "🖼️" if col.is_image_column else ""
-        })
-    
-    schema_df = pd.DataFrame(schema_data)
+    # Create schema dataframe straight from the per-attribute arrays
+    schema = metadata.schema
+    schema_df = pd.DataFrame({
+        "Column Name": schema.names,
+        "Data Type": schema.types,
+        "Nullable": np.where(schema.nullables, "✓", "✗"),
+        "Image Column": np.where(schema.is_image, "🖼️", "")
+    })
     
     st.dataframe(
         schema_df,
@@ -586,14 +651,15 @@ def show_statistics_view():
     # Column selector
     column_name = st.selectbox(
         "Select column",
-        [col.name for col in st.session_state.file_metadata.schema],
+        st.session_state.file_metadata.column_names,
         key="stats_column_selector"
     )
     
     if column_name:
         try:
-            stats = parquet_service.get_column_stats(
-                st.session_state.parquet_file,
+            stats = get_cached_column_stats(
+                st.session_state.current_file,
+                st.session_state.file_mtime_ns,
                 column_name
             )
             
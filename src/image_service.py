@@ -6,26 +6,97 @@ supporting both embedded binary images and file path references.
 """
 
 import io
-from typing import Optional, Tuple
-from PIL import Image
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple, Union
+from PIL import Image, features
 import base64
 
 
+# Pillow wheels ship libjpeg-turbo (and Pillow-SIMD can be built against it);
+# a build linked to stock libjpeg decodes JPEG tiles several times slower.
+LIBJPEG_TURBO = bool(features.check_feature("libjpeg_turbo"))
+if not LIBJPEG_TURBO:
+    print("Warning: Pillow is not linked against libjpeg-turbo, JPEG decoding will be slow")
+
+
+# Any buffer PIL can read through io.BytesIO without an extra copy
+ImageBytes = Union[bytes, bytearray, memoryview]
+
+# How to get the encoded image out of a cell, by exact cell type. Dicts are
+# the HuggingFace datasets layout: {"bytes": ..., "path": ...}
+_IMAGE_DATA_HANDLERS = {
+    bytes: lambda data: data,
+    bytearray: lambda data: data,
+    memoryview: lambda data: data,
+    dict: lambda data: data.get("bytes"),
+}
+
+# Leading bytes of common image formats, mapped to PIL format names
+_MAGIC_NUMBERS = (
+    (b"\xff\xd8\xff", "JPEG"),
+    (b"\x89PNG\r\n\x1a\n", "PNG"),
+    (b"GIF87a", "GIF"),
+    (b"GIF89a", "GIF"),
+    (b"BM", "BMP"),
+    (b"II*\x00", "TIFF"),
+    (b"MM\x00*", "TIFF"),
+)
+
+
+@dataclass(frozen=True)
+class Thumbnail:
+    """WEBP-encoded thumbnail plus the source image details shown with it"""
+    webp_bytes: bytes
+    format: Optional[str]
+    original_size: Tuple[int, int]  # (width, height) before downscaling
+    mode: str
+
+
 class ImageService:
     """Service for handling image operations"""
     
-    def extract_image(self, image_data: bytes) -> Optional[Image.Image]:
+    def __init__(self, cache_size: int = 512):
+        # Encoded thumbnails keyed by content hash + size, in LRU order. The
+        # decoded pixels are not kept, so an entry is only tens of KB
+        self._thumbnail_cache: "OrderedDict[bytes, Thumbnail]" = OrderedDict()
+        self._cache_size = cache_size
+        self._cache_lock = threading.Lock()
+    
+    def extract_bytes(self, image_data: Any) -> Optional[ImageBytes]:
+        """
+        Get the encoded image bytes from a Parquet cell value
+        
+        Args:
+            image_data: Cell value (bytes, or dict with "bytes" key)
+            
+        Returns:
+            Non-empty image bytes or None if the cell holds no image data
+        """
+        handler = _IMAGE_DATA_HANDLERS.get(type(image_data))
+        if handler is None:
+            return None
+        raw = handler(image_data)
+        return raw if isinstance(raw, (bytes, bytearray, memoryview)) and len(raw) > 0 else None
+    
+    def extract_image(self, image_data: ImageBytes) -> Optional[Image.Image]:
         """
         Extract image from binary data
         
         Args:
-            image_data: Binary image data
+            image_data: Binary image data (bytes-like, not copied)
             
         Returns:
             PIL Image object or None if extraction fails
         """
         try:
-            return Image.open(io.BytesIO(image_data))
+            image = Image.open(io.BytesIO(image_data))
+            # Decode now rather than lazily on first pixel access, so the
+            # work happens on the calling (possibly worker) thread
+            image.load()
+            return image
         except Exception as e:
             print(f"Error extracting image: {e}")
             return None
@@ -40,6 +111,14 @@ class ImageService:
         Returns:
             Image format string (PNG, JPEG, WEBP, etc.) or UNKNOWN
         """
+        # Sniff the header first; only fall back to PIL for other formats
+        header = bytes(image_data[:12])
+        if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+            return "WEBP"
+        for magic, format_name in _MAGIC_NUMBERS:
+            if header.startswith(magic):
+                return format_name
+        
         try:
             img = Image.open(io.BytesIO(image_data))
             return img.format or "UNKNOWN"
@@ -76,6 +155,42 @@ class ImageService:
         image.save(buffer, format=image.format or 'PNG')
         return base64.b64encode(buffer.getvalue()).decode()
     
+    def bytes_to_data_url(self, raw: ImageBytes, mime: str) -> str:
+        """
+        Wrap already-encoded image bytes in a data URL without re-encoding
+        
+        Args:
+            raw: Encoded image bytes
+            mime: MIME type of the bytes (e.g. image/webp)
+            
+        Returns:
+            Data URL string (data:<mime>;base64,...)
+        """
+        return f"data:{mime};base64,{base64.b64encode(raw).decode()}"
+    
+    def encode_image(
+        self,
+        image: Image.Image,
+        format: str = "WEBP",
+        quality: int = 80
+    ) -> bytes:
+        """
+        Encode PIL Image to bytes
+        
+        Args:
+            image: PIL Image object
+            format: Output format (default: WEBP)
+            quality: Encoder quality for lossy formats
+            
+        Returns:
+            Encoded image bytes
+        """
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+        buffer = io.BytesIO()
+        image.save(buffer, format=format, quality=quality)
+        return buffer.getvalue()
+    
     def create_thumbnail(
         self,
         image: Image.Image,
@@ -94,3 +209,77 @@ class ImageService:
         thumbnail = image.copy()
         thumbnail.thumbnail(size, Image.Resampling.LANCZOS)
         return thumbnail
+    
+    def get_thumbnail(self, image_data: ImageBytes, size: int) -> Optional[Thumbnail]:
+        """
+        Get a WEBP thumbnail, reusing previously encoded results
+        
+        Thumbnails are cached by a hash of the image bytes and the requested
+        size, so pagination and reruns don't decode or encode the same image
+        twice.
+        
+        Args:
+            image_data: Binary image data (bytes-like, not copied)
+            size: Maximum thumbnail width/height in pixels
+            
+        Returns:
+            Thumbnail with the WEBP bytes and the source format, size and
+            mode, or None if extraction fails
+        """
+        key = self._cache_key(image_data, size)
+        thumbnail = self._cache_get(key)
+        if thumbnail is not None:
+            return thumbnail
+        
+        try:
+            image = Image.open(io.BytesIO(image_data))
+            original_size = image.size
+            # thumbnail() lets JPEG decode at a reduced scale (draft mode)
+            image.thumbnail((size, size), Image.Resampling.LANCZOS)
+            image.load()
+            thumbnail = Thumbnail(
+                webp_bytes=self.encode_image(image),
+                format=image.format,
+                original_size=original_size,
+                mode=image.mode,
+            )
+        except Exception as e:
+            print(f"Error extracting image: {e}")
+            return None
+        
+        self._cache_put(key, thumbnail)
+        return thumbnail
+    
+    def thumbnail_webp_bytes(self, image_data: ImageBytes, size: int) -> Optional[bytes]:
+        """
+        Get a thumbnail encoded as WEBP, ready to send to the browser
+        
+        Args:
+            image_data: Binary image data (bytes-like, not copied)
+            size: Maximum thumbnail width/height in pixels
+            
+        Returns:
+            WEBP encoded bytes or None if extraction fails
+        """
+        thumbnail = self.get_thumbnail(image_data, size)
+        return thumbnail.webp_bytes if thumbnail is not None else None
+    
+    def _cache_key(self, image_data: ImageBytes, size: int) -> bytes:
+        """Build a cache key from the image content and thumbnail size"""
+        return hashlib.blake2b(image_data, digest_size=16).digest() + size.to_bytes(2, "little")
+    
+    def _cache_get(self, key: bytes) -> Optional[Thumbnail]:
+        """Look up a cache entry and mark it as most recently used"""
+        with self._cache_lock:
+            value = self._thumbnail_cache.get(key)
+            if value is not None:
+                self._thumbnail_cache.move_to_end(key)
+            return value
+    
+    def _cache_put(self, key: bytes, value: Thumbnail):
+        """Store a cache entry, evicting the least recently used ones"""
+        with self._cache_lock:
+            self._thumbnail_cache[key] = value
+            self._thumbnail_cache.move_to_end(key)
+            while len(self._thumbnail_cache) > self._cache_size:
+                self._thumbnail_cache.popitem(last=False)
@@ -7,12 +7,62 @@ SNAPPY, GZIP, and LZ4.
 """
 
 import os
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass
+import re
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional, Any, Tuple
+from dataclasses import dataclass, field
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 import pandas as pd
 
 
+# Column name keywords that mark a column as holding images
+IMAGE_KEYWORDS = frozenset({'image', 'img', 'picture', 'photo', 'thumbnail'})
+_IMAGE_NAME_PATTERN = re.compile("|".join(sorted(IMAGE_KEYWORDS)))  # matched on lowercased names
+
+# Rows decoded at a time when reading parts of row groups
+READ_BATCH_SIZE = 65536
+
+# Column chunks are streamed through a buffer of this size instead of being
+# loaded whole, so large row groups don't have to fit in memory at once.
+# Files are opened without pre_buffer, which would read each chunk whole
+# into Arrow's read cache and bypass this buffer
+READ_BUFFER_SIZE = 1 << 20
+
+# Total size of the sort orders kept across open files, least recently used
+# dropped first; each holds one row position per file row (4 bytes below
+# 2**32 rows, else 8), so larger orders are not cached at all
+SORT_ORDER_CACHE_BYTES = 64 << 20
+
+# Characters that can occur in the text form Arrow casts these column types
+# to (e.g. "-12", "1.5e+20", "nan", "-inf", "1.0E+3", "false"); a lowercased
+# search term with any other character can't match such a column
+_TEXT_FORM_CHARS = [
+    (pa.types.is_integer, frozenset("0123456789-")),
+    (pa.types.is_floating, frozenset("0123456789-+.einfa")),
+    (pa.types.is_decimal, frozenset("0123456789-+.e")),
+    (pa.types.is_boolean, frozenset("truefals")),
+]
+
+# Arrow compute kernels for filter_rows operators, each returning a row mask
+_FILTER_KERNELS = {
+    "equals": lambda column, value: (
+        pc.is_in(column, value_set=pa.array(list(value), type=column.type))
+        if isinstance(value, (list, tuple, set, frozenset))
+        else pc.equal(column, value)
+    ),
+    "contains": lambda column, value: pc.match_substring(column, str(value)),
+    "gt": pc.greater,
+    "lt": pc.less,
+    "gte": pc.greater_equal,
+    "lte": pc.less_equal,
+}
+
+
 @dataclass
 class ColumnSchema:
     """Schema information for a single column"""
@@ -22,6 +72,33 @@ class ColumnSchema:
     is_image_column: bool
 
 
+@dataclass(eq=False)
+class FileSchema:
+    """
+    Schema information for all columns, stored as one array per attribute
+    
+    Indexing or iterating yields ColumnSchema views built on demand.
+    """
+    names: np.ndarray      # object (str)
+    types: np.ndarray      # object (str)
+    nullables: np.ndarray  # bool
+    is_image: np.ndarray   # bool
+    
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    def __getitem__(self, i: int) -> ColumnSchema:
+        return ColumnSchema(
+            name=self.names[i],
+            type=self.types[i],
+            nullable=bool(self.nullables[i]),
+            is_image_column=bool(self.is_image[i])
+        )
+    
+    def __iter__(self) -> Iterator[ColumnSchema]:
+        return (self[i] for i in range(len(self)))
+
+
 @dataclass
 class FileMetadata:
     """Metadata for a Parquet file"""
@@ -29,16 +106,46 @@ class FileMetadata:
     file_size: int
     row_count: int
     column_count: int
-    schema: List[ColumnSchema]
+    schema: FileSchema
     compression: str
     metadata: Dict[str, str]
+    column_names: List[str] = field(init=False)
+    
+    def __post_init__(self):
+        # Precomputed once so UI reruns don't walk the schema again
+        self.column_names = self.schema.names.tolist()
+
+
+@dataclass
+class CachedFile:
+    """Open Parquet file plus footer-derived indexes, cached per file version"""
+    parquet_file: pq.ParquetFile
+    file_metadata: FileMetadata
+    cache_key: Tuple[int, int]  # (st_mtime_ns, st_size)
+    schema_arrow: pa.Schema
+    rg_row_counts: np.ndarray
+    rg_cum_rows: np.ndarray  # end row (exclusive) of each row group
+    searchable_columns: List[str]
+    col_stats: Dict[str, Optional[Dict[str, Any]]] = field(default_factory=dict)
 
 
 class ParquetService:
     """Service for handling Parquet file operations"""
     
-    def __init__(self):
-        self._file_cache: Dict[str, pq.ParquetFile] = {}
+    def __init__(self, max_open_files: int = 32, max_sort_order_bytes: int = SORT_ORDER_CACHE_BYTES):
+        # Least recently used files are dropped beyond max_open_files
+        self._file_cache: "OrderedDict[str, CachedFile]" = OrderedDict()
+        self._max_open_files = max_open_files
+        self._cache_lock = threading.Lock()
+        # Same entries looked up by handle, for methods given a ParquetFile
+        self._cached_by_file: "weakref.WeakKeyDictionary[pq.ParquetFile, CachedFile]" = (
+            weakref.WeakKeyDictionary()
+        )
+        # Sort orders of cached files keyed by (id(entry), column, ascending),
+        # least recently used dropped beyond max_sort_order_bytes in total
+        self._sort_orders: "OrderedDict[Tuple[int, str, bool], np.ndarray]" = OrderedDict()
+        self._sort_order_bytes = 0
+        self._max_sort_order_bytes = max_sort_order_bytes
     
     def parse_file(self, file_path: str) -> Tuple[pq.ParquetFile, FileMetadata]:
         """
@@ -58,18 +165,34 @@ class ParquetService:
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
         
+        # Reuse the cached parse while the file is unchanged on disk
+        stat = os.stat(file_path)
+        cache_key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._cache_get(file_path)
+        if cached is not None and cached.cache_key == cache_key:
+            return cached.parquet_file, cached.file_metadata
+        
         try:
-            # Open Parquet file
-            parquet_file = pq.ParquetFile(file_path)
+            # Open Parquet file with buffered column reads; regular files are
+            # memory-mapped so repeated reads come straight from the page cache
+            parquet_file = pq.ParquetFile(
+                file_path,
+                memory_map=os.path.isfile(file_path),
+                buffer_size=READ_BUFFER_SIZE
+            )
+            
+            # Build the Arrow schema once; ParquetFile.schema_arrow converts
+            # the Parquet schema again on every access
+            schema_arrow = parquet_file.schema_arrow
             
             # Extract schema
-            schema = self._extract_schema(parquet_file)
+            schema = self._extract_schema(schema_arrow)
             
             # Extract metadata
-            metadata = self._extract_metadata(parquet_file)
+            metadata = self._extract_metadata(schema_arrow)
             
             # Get file info
-            file_size = os.path.getsize(file_path)
+            file_size = stat.st_size
             file_name = os.path.basename(file_path)
             row_count = parquet_file.metadata.num_rows
             column_count = len(schema)
@@ -88,8 +211,18 @@ class ParquetService:
                 metadata=metadata
             )
             
-            # Cache the file
-            self._file_cache[file_path] = parquet_file
+            # Cache the file with its row group index
+            rg_row_counts = self._row_group_row_counts(parquet_file.metadata)
+            cached = CachedFile(
+                parquet_file=parquet_file,
+                file_metadata=file_metadata,
+                cache_key=cache_key,
+                schema_arrow=schema_arrow,
+                rg_row_counts=rg_row_counts,
+                rg_cum_rows=np.cumsum(rg_row_counts),
+                searchable_columns=self._searchable_columns(schema_arrow)
+            )
+            self._cache_put(file_path, cached)
             
             return parquet_file, file_metadata
             
@@ -105,14 +238,18 @@ class ParquetService:
         limit: int = 100,
         sort_column: Optional[str] = None,
         sort_ascending: bool = True,
-        sample_large_files: bool = True,
-        large_file_threshold: int = 1000000  # 1 million rows
+        columns: Optional[List[str]] = None
     ) -> pd.DataFrame:
         """
         Get rows from Parquet file with pagination and optional sorting
         
-        For large files (> threshold rows), uses efficient row group reading
-        to avoid loading entire file into memory.
+        Only the row groups holding the requested rows are read, whatever the
+        file size, and only those rows are converted to pandas. Sorting
+        applies to the whole file before pagination: the sort column is read
+        in full and its order cached (SORT_ORDER_CACHE_BYTES across files),
+        but a sorted page's rows are spread over most row groups, so every
+        page decodes the requested columns of nearly the whole file. Pass
+        columns to keep that cost down.
         
         Args:
             parquet_file: ParquetFile object
@@ -120,41 +257,116 @@ class ParquetService:
             limit: Maximum number of rows to return
             sort_column: Column name to sort by (optional)
             sort_ascending: Sort direction (default: ascending)
-            sample_large_files: Use sampling for very large files
-            large_file_threshold: Row count threshold for sampling
+            columns: Columns to read (default: all)
             
         Returns:
-            DataFrame with requested rows
+            DataFrame with requested rows, indexed by row position
         """
-        total_rows = parquet_file.metadata.num_rows
+        table, row_index = self._read_page(
+            parquet_file, offset, limit, sort_column, sort_ascending, columns
+        )
+        df = self._to_pandas(table)
+        df.index = row_index
+        return df
+    
+    def get_rows_arrow(
+        self,
+        parquet_file: pq.ParquetFile,
+        offset: int = 0,
+        limit: int = 100,
+        sort_column: Optional[str] = None,
+        sort_ascending: bool = True,
+        columns: Optional[List[str]] = None
+    ) -> pa.Table:
+        """
+        Get rows from Parquet file as an Arrow Table, without pandas conversion
         
-        # For very large files, use efficient row group reading
-        if total_rows > large_file_threshold and sample_large_files:
-            # Read only the row groups we need
-            df = self._read_row_groups_efficiently(
-                parquet_file, offset, limit
-            )
-        else:
-            # For smaller files, read entire table
-            table = parquet_file.read()
-            df = table.to_pandas()
+        Same reading and sorting as get_rows. Without sorting the result is
+        a zero-copy slice of the decoded data, so callers that don't need a
+        DataFrame (e.g. to pull out one column) skip the conversion copy.
+        
+        Args:
+            parquet_file: ParquetFile object
+            offset: Starting row index
+            limit: Maximum number of rows to return
+            sort_column: Column name to sort by (optional)
+            sort_ascending: Sort direction (default: ascending)
+            columns: Columns to read (default: all)
             
-            # Apply pagination
-            end = min(offset + limit, len(df))
-            df = df.iloc[offset:end]
+        Returns:
+            Arrow Table with requested rows
+        """
+        table, _ = self._read_page(
+            parquet_file, offset, limit, sort_column, sort_ascending, columns
+        )
+        return table
+    
+    def _read_page(
+        self,
+        parquet_file: pq.ParquetFile,
+        offset: int,
+        limit: int,
+        sort_column: Optional[str],
+        sort_ascending: bool,
+        columns: Optional[List[str]]
+    ) -> Tuple[pa.Table, pd.Index]:
+        """Read one page as an Arrow Table, plus the row position of each row"""
+        if sort_column and sort_column in self._arrow_schema(parquet_file).names:
+            order = self._sort_order(parquet_file, sort_column, sort_ascending)
+            positions = order[offset:offset + limit].astype(np.int64)
+            if columns is None:
+                columns = self._arrow_schema(parquet_file).names
+            # Take the page's rows in file order, then put them back in sort order
+            file_order = np.argsort(positions, kind='stable')
+            table = self._take_from_row_groups(parquet_file, positions[file_order], columns)
+            table = table.take(pa.array(np.argsort(file_order)))
+            return table, pd.Index(positions)
         
-        # Apply sorting if requested
-        if sort_column and sort_column in df.columns:
-            df = df.sort_values(by=sort_column, ascending=sort_ascending)
+        # Read only the row groups we need; small files get no full read either
+        table = self._read_row_groups_efficiently(parquet_file, offset, limit, columns)
+        return table, pd.RangeIndex(offset, offset + table.num_rows)
+    
+    def _sort_order(
+        self,
+        parquet_file: pq.ParquetFile,
+        sort_column: str,
+        sort_ascending: bool
+    ) -> np.ndarray:
+        """File row positions in sort order of one column, nulls last, ties in file order"""
+        cached = self._cached_by_file.get(parquet_file)
+        key = (id(cached), sort_column, sort_ascending)
+        if cached is not None:
+            with self._cache_lock:
+                positions = self._sort_orders.get(key)
+                if positions is not None:
+                    self._sort_orders.move_to_end(key)
+                    return positions
         
-        return df
+        table = parquet_file.read(columns=[sort_column])
+        order = "ascending" if sort_ascending else "descending"
+        dtype = np.uint32 if table.num_rows < 2 ** 32 else np.int64
+        positions = pc.sort_indices(table, sort_keys=[(sort_column, order)]).to_numpy().astype(dtype)
+        if cached is not None and positions.nbytes <= self._max_sort_order_bytes:
+            with self._cache_lock:
+                # Skip entries evicted meanwhile; their orders are never dropped
+                if self._cached_by_file.get(parquet_file) is cached:
+                    previous = self._sort_orders.pop(key, None)
+                    if previous is not None:
+                        self._sort_order_bytes -= previous.nbytes
+                    self._sort_orders[key] = positions
+                    self._sort_order_bytes += positions.nbytes
+                    while self._sort_order_bytes > self._max_sort_order_bytes:
+                        _, dropped = self._sort_orders.popitem(last=False)
+                        self._sort_order_bytes -= dropped.nbytes
+        return positions
     
     def _read_row_groups_efficiently(
         self,
         parquet_file: pq.ParquetFile,
         offset: int,
-        limit: int
-    ) -> pd.DataFrame:
+        limit: int,
+        columns: Optional[List[str]] = None
+    ) -> pa.Table:
         """
         Efficiently read specific rows from large Parquet files using row groups
         
@@ -162,57 +374,44 @@ class ParquetService:
             parquet_file: ParquetFile object
             offset: Starting row index
             limit: Maximum number of rows to return
+            columns: Columns to read (default: all)
             
         Returns:
-            DataFrame with requested rows
+            Arrow Table with requested rows
         """
-        # Find which row groups contain our target rows
-        row_groups_to_read = []
-        current_row = 0
-        
-        for i in range(parquet_file.metadata.num_row_groups):
-            rg_metadata = parquet_file.metadata.row_group(i)
-            rg_num_rows = rg_metadata.num_rows
-            
-            # Check if this row group contains rows we need
-            if current_row + rg_num_rows > offset and current_row < offset + limit:
-                row_groups_to_read.append(i)
-            
-            current_row += rg_num_rows
-            
-            # Stop if we've passed our target range
-            if current_row >= offset + limit:
-                break
+        # Find which row groups contain our target rows (binary search over
+        # the cumulative row counts)
+        _, rg_cum_rows = self._row_group_index(parquet_file)
+        num_row_groups = len(rg_cum_rows)
+        first = int(np.searchsorted(rg_cum_rows, offset, side='right'))
         
         # Read only the necessary row groups
-        if not row_groups_to_read:
-            # Return empty DataFrame with correct schema
-            return pd.DataFrame(columns=[field.name for field in parquet_file.schema_arrow])
-        
-        # Read the row groups
-        tables = []
-        for rg_idx in row_groups_to_read:
-            table = parquet_file.read_row_group(rg_idx)
-            tables.append(table)
-        
-        # Combine tables
-        if len(tables) == 1:
-            combined_table = tables[0]
-        else:
-            import pyarrow as pa
-            combined_table = pa.concat_tables(tables)
-        
-        df = combined_table.to_pandas()
+        if limit <= 0 or first >= num_row_groups:
+            # Return empty table with correct schema
+            return self._empty_table(parquet_file, columns)
         
-        # Calculate the offset within the combined data
-        rows_before_first_group = 0
-        for i in range(row_groups_to_read[0]):
-            rows_before_first_group += parquet_file.metadata.row_group(i).num_rows
+        last = min(
+            int(np.searchsorted(rg_cum_rows, offset + limit - 1, side='right')),
+            num_row_groups - 1
+        )
+        row_groups_to_read = list(range(first, last + 1))
         
-        local_offset = offset - rows_before_first_group
-        local_end = local_offset + limit
+        # Stream the row groups in batches, keeping only the batches that
+        # overlap the requested rows and stopping once they are covered
+        batch_start = int(rg_cum_rows[first - 1]) if first else 0
+        batches = []
+        for batch in parquet_file.iter_batches(
+            batch_size=READ_BATCH_SIZE, row_groups=row_groups_to_read, columns=columns
+        ):
+            batch_end = batch_start + batch.num_rows
+            if batch_end > offset:
+                batches.append(batch.slice(max(offset - batch_start, 0)))
+            if batch_end >= offset + limit:
+                break
+            batch_start = batch_end
         
-        return df.iloc[local_offset:local_end]
+        table = pa.Table.from_batches(batches, schema=self._empty_table(parquet_file, columns).schema)
+        return table.slice(0, limit)
     
     def get_sample_rows(
         self,
@@ -234,213 +433,627 @@ class ParquetService:
         Returns:
             DataFrame with sampled rows
         """
+        return self._to_pandas(self.get_sample_table(parquet_file, sample_size, random_seed))
+    
+    def get_sample_table(
+        self,
+        parquet_file: pq.ParquetFile,
+        sample_size: int = 10000,
+        random_seed: Optional[int] = 42
+    ) -> pa.Table:
+        """
+        Get a random sample of rows from a large Parquet file as an Arrow Table
+        
+        Keeping the sample in Arrow lets callers sort, search and slice it
+        with Arrow compute and only convert the rows they display. Sampled
+        rows are returned in file order.
+        
+        Args:
+            parquet_file: ParquetFile object
+            sample_size: Number of rows to sample
+            random_seed: Random seed for reproducibility
+            
+        Returns:
+            Arrow Table with sampled rows
+        """
         total_rows = parquet_file.metadata.num_rows
         
         if total_rows <= sample_size:
             # File is small enough, return all rows
-            return parquet_file.read().to_pandas()
+            return parquet_file.read()
         
-        # Calculate sampling ratio
-        sample_ratio = sample_size / total_rows
+        # Draw exactly sample_size distinct rows over the whole file in one
+        # pass, then read them row group by row group in file order
+        rng = np.random.default_rng(random_seed)
+        indices = np.sort(rng.choice(total_rows, size=sample_size, replace=False))
+        return self._take_from_row_groups(parquet_file, indices, self._arrow_schema(parquet_file).names)
+    
+    def sort_sample(
+        self,
+        table: pa.Table,
+        sort_column: str,
+        sort_ascending: bool = True
+    ) -> pa.Table:
+        """
+        Sort an in-memory Arrow Table (e.g. a sample) by one column
         
-        # Read row groups and sample
-        import numpy as np
-        if random_seed is not None:
-            np.random.seed(random_seed)
+        Args:
+            table: Arrow Table
+            sort_column: Column name to sort by
+            sort_ascending: Sort direction (default: ascending)
+            
+        Returns:
+            Sorted Arrow Table (nulls last)
+        """
+        order = "ascending" if sort_ascending else "descending"
+        return table.take(pc.sort_indices(table, sort_keys=[(sort_column, order)]))
+    
+    def search_sample(self, table: pa.Table, search_term: str) -> pa.Table:
+        """
+        Search an in-memory Arrow Table (e.g. a sample) for a term
+        
+        Matching is a case-insensitive substring match against the text of
+        every column. Image, binary and nested columns are skipped.
         
-        sampled_dfs = []
-        for i in range(parquet_file.metadata.num_row_groups):
-            rg_metadata = parquet_file.metadata.row_group(i)
-            rg_num_rows = rg_metadata.num_rows
+        Args:
+            table: Arrow Table
+            search_term: Term to search for
             
-            # Calculate how many rows to sample from this row group
-            rg_sample_size = int(rg_num_rows * sample_ratio)
+        Returns:
+            Arrow Table with matching rows
+        """
+        search_table = table.select(self._searchable_columns(table.schema))
+        mask = self._search_mask(search_table, str(search_term))
+        if mask is None:
+            return table.slice(0, 0)
+        return table.filter(mask)
+    
+    def slice_sample(self, table: pa.Table, offset: int, limit: int) -> pd.DataFrame:
+        """
+        Get one page of an in-memory Arrow Table as a DataFrame
+        
+        Only the page's rows are converted to pandas, the same way get_rows
+        converts its pages.
+        
+        Args:
+            table: Arrow Table
+            offset: Starting row index
+            limit: Maximum number of rows to return
             
-            if rg_sample_size > 0:
-                # Read the row group
-                table = parquet_file.read_row_group(i)
-                df = table.to_pandas()
-                
-                # Sample rows
-                if len(df) > rg_sample_size:
-                    sampled_df = df.sample(n=rg_sample_size, random_state=random_seed)
-                else:
-                    sampled_df = df
-                
-                sampled_dfs.append(sampled_df)
-        
-        # Combine all sampled data
-        if sampled_dfs:
-            result = pd.concat(sampled_dfs, ignore_index=True)
-            # Ensure we don't exceed sample_size
-            if len(result) > sample_size:
-                result = result.sample(n=sample_size, random_state=random_seed)
-            return result
-        else:
-            # Return empty DataFrame with correct schema
-            return pd.DataFrame(columns=[field.name for field in parquet_file.schema_arrow])
+        Returns:
+            DataFrame with the requested rows, indexed by row position
+        """
+        df = self._to_pandas(table.slice(offset, limit))
+        df.index = pd.RangeIndex(offset, offset + len(df))
+        return df
     
     def search_rows(
         self,
         parquet_file: pq.ParquetFile,
-        search_term: str
+        search_term: str,
+        columns: Optional[List[str]] = None
     ) -> pd.DataFrame:
         """
         Search for rows containing the search term in any column
         
+        Matching is case-insensitive and runs on the Arrow table; image,
+        binary and nested columns are not searched. Only the searched
+        columns are decoded for the whole file; the remaining columns are
+        read just for row groups that contain matches.
+        
         Args:
             parquet_file: ParquetFile object
             search_term: Term to search for
+            columns: Columns to search and return (default: all)
             
         Returns:
-            DataFrame with matching rows
+            DataFrame with matching rows, indexed by row position
         """
-        table = parquet_file.read()
-        df = table.to_pandas()
+        schema = self._arrow_schema(parquet_file)
+        columns = list(schema.names if columns is None else columns)
+        cached = self._cached_by_file.get(parquet_file)
+        searchable = set(
+            cached.searchable_columns if cached is not None
+            else self._searchable_columns(schema)
+        )
+        search_columns = [name for name in columns if name in searchable]
+        table = parquet_file.read(columns=search_columns)
         
-        # Convert search term to string and lowercase
-        search_term = str(search_term).lower()
+        # Search across all text-castable columns with Arrow compute
+        mask = self._search_mask(table, str(search_term))
+        # An empty read has no chunks, which indices_nonzero can't handle
+        if mask is None or table.num_rows == 0:
+            return self._to_pandas(self._empty_table(parquet_file, columns))
         
-        # Search across all columns
-        mask = df.astype(str).apply(
-            lambda col: col.str.lower().str.contains(search_term, na=False)
-        ).any(axis=1)
+        indices = pc.indices_nonzero(mask).to_numpy().astype(np.int64)
+        if len(search_columns) == len(columns):
+            matches = table.take(indices).select(columns)
+        else:
+            matches = self._take_from_row_groups(parquet_file, indices, columns)
+        del table
         
-        return df[mask]
+        df = self._to_pandas(matches)
+        # Keep the original row positions as the index
+        df.index = pd.Index(indices)
+        return df
     
     def filter_rows(
         self,
         parquet_file: pq.ParquetFile,
-        filters: List[Dict[str, Any]]
+        filters: List[Dict[str, Any]],
+        columns: Optional[List[str]] = None
     ) -> pd.DataFrame:
         """
         Filter rows based on column conditions
         
+        Row groups whose min/max statistics rule out a match are skipped
+        without being read. The remaining rows are filtered in Arrow on the
+        filter columns alone; other columns are read only for row groups
+        that contain matches.
+        
         Args:
             parquet_file: ParquetFile object
             filters: List of filter conditions
                 Each filter: {"column": str, "operator": str, "value": Any}
                 Operators: "equals", "contains", "gt", "lt", "gte", "lte"
+                ("equals" also accepts a list of values)
+            columns: Columns to return (default: all)
                 
         Returns:
-            DataFrame with filtered rows
+            DataFrame with filtered rows, indexed by row position
         """
-        table = parquet_file.read()
-        df = table.to_pandas()
+        schema = self._arrow_schema(parquet_file)
+        columns = list(schema.names if columns is None else columns)
+        filters = [
+            f for f in filters
+            if f["column"] in schema.names and f["operator"] in _FILTER_KERNELS
+        ]
+        
+        # Predicate pushdown: only read row groups that may contain matches.
+        # Column chunk indices are resolved once, not per row group; nested
+        # columns have no chunk of their own and are never pruned
+        metadata = parquet_file.metadata
+        chunk_indices = {
+            metadata.schema.column(i).path: i for i in range(metadata.num_columns)
+        }
+        chunk_filters = [
+            (f, chunk_indices[f["column"]]) for f in filters if f["column"] in chunk_indices
+        ]
+        row_groups = [
+            i for i in range(metadata.num_row_groups)
+            if self._row_group_may_match(metadata.row_group(i), chunk_filters)
+        ]
+        if not row_groups:
+            return self._to_pandas(self._empty_table(parquet_file, columns))
+        if not filters:
+            return self._to_pandas(
+                parquet_file.read_row_groups(row_groups, columns=columns)
+            )
+        
+        # Evaluate the filters on their own columns only
+        filter_columns = list(dict.fromkeys(f["column"] for f in filters))
+        table = parquet_file.read_row_groups(row_groups, columns=filter_columns)
+        # Only empty row groups may be left; their columns have no chunks,
+        # which indices_nonzero can't handle
+        if table.num_rows == 0:
+            return self._to_pandas(self._empty_table(parquet_file, columns))
         
-        # Apply each filter
+        # Combine one kernel mask per filter on the typed columns
+        mask = None
         for filter_spec in filters:
-            column = filter_spec["column"]
-            operator = filter_spec["operator"]
-            value = filter_spec["value"]
-            
-            if column not in df.columns:
-                continue
-            
-            if operator == "equals":
-                df = df[df[column] == value]
-            elif operator == "contains":
-                df = df[df[column].astype(str).str.contains(str(value), na=False)]
-            elif operator == "gt":
-                df = df[df[column] > value]
-            elif operator == "lt":
-                df = df[df[column] < value]
-            elif operator == "gte":
-                df = df[df[column] >= value]
-            elif operator == "lte":
-                df = df[df[column] <= value]
+            condition = self._filter_mask(
+                table.column(filter_spec["column"]), filter_spec["operator"], filter_spec["value"]
+            )
+            if condition is None:
+                return self._to_pandas(self._empty_table(parquet_file, columns))
+            mask = condition if mask is None else pc.and_kleene(mask, condition)
+        
+        indices = pc.indices_nonzero(pc.fill_null(mask, False)).to_numpy().astype(np.int64)
+        positions = self._file_positions(parquet_file, row_groups, indices)
         
+        if set(columns) <= set(filter_columns):
+            matches = table.take(indices).select(columns)
+        else:
+            matches = self._take_from_row_groups(parquet_file, positions, columns)
+        del table
+        
+        df = self._to_pandas(matches)
+        # Keep the original row positions as the index
+        df.index = pd.Index(positions)
         return df
     
     def get_column_stats(
         self,
         parquet_file: pq.ParquetFile,
-        column_name: str
+        column_name: str,
+        full: bool = True
     ) -> Dict[str, Any]:
         """
         Get statistics for a specific column
         
+        Count, null count, min and max come from the row group statistics in
+        the file footer when available, without decoding the column. Only the
+        column itself is read when the footer lacks statistics or when the
+        full statistics (unique count, mean, median) are requested.
+        
         Args:
             parquet_file: ParquetFile object
             column_name: Name of the column
+            full: Also compute unique_count, mean and median
             
         Returns:
             Dictionary with column statistics
         """
-        table = parquet_file.read()
-        df = table.to_pandas()
-        
-        if column_name not in df.columns:
+        schema = self._arrow_schema(parquet_file)
+        if column_name not in schema.names:
             raise ValueError(f"Column '{column_name}' not found")
         
-        col = df[column_name]
-        stats = {
-            "count": len(col),
-            "null_count": col.isna().sum(),
-            "unique_count": col.nunique(),
-        }
+        field_type = schema.field(column_name).type
+        is_numeric = (
+            pa.types.is_integer(field_type) or
+            pa.types.is_floating(field_type) or
+            pa.types.is_boolean(field_type)
+        )
+        
+        cached = self._cached_by_file.get(parquet_file)
+        if cached is not None:
+            if column_name not in cached.col_stats:
+                cached.col_stats[column_name] = self._footer_column_stats(
+                    parquet_file.metadata, column_name
+                )
+            footer_stats = cached.col_stats[column_name]
+        else:
+            footer_stats = self._footer_column_stats(parquet_file.metadata, column_name)
+        col = None
+        if footer_stats is None or full:
+            col = self._to_pandas(parquet_file.read(columns=[column_name]))[column_name]
+        
+        stats = {"count": parquet_file.metadata.num_rows}
+        if footer_stats is not None:
+            stats["null_count"] = footer_stats["null_count"]
+        else:
+            stats["null_count"] = col.isna().sum()
+        
+        if full:
+            stats["unique_count"] = col.nunique()
         
         # Add numeric statistics if applicable
-        if pd.api.types.is_numeric_dtype(col):
-            stats.update({
-                "min": col.min(),
-                "max": col.max(),
-                "mean": col.mean(),
-                "median": col.median(),
-            })
+        if is_numeric:
+            if footer_stats is not None:
+                stats.update({"min": footer_stats["min"], "max": footer_stats["max"]})
+            else:
+                stats.update({"min": col.min(), "max": col.max()})
+            if full:
+                stats.update({"mean": col.mean(), "median": col.median()})
         
         return stats
     
-    def _extract_schema(self, parquet_file: pq.ParquetFile) -> List[ColumnSchema]:
-        """Extract schema information from Parquet file"""
-        schema = parquet_file.schema_arrow
-        columns = []
+    def _file_positions(
+        self,
+        parquet_file: pq.ParquetFile,
+        row_groups: List[int],
+        indices: np.ndarray
+    ) -> np.ndarray:
+        """Map positions within the concatenation of row_groups to file row positions"""
+        rg_row_counts, rg_cum_rows = self._row_group_index(parquet_file)
+        row_groups = np.asarray(row_groups, dtype=np.int64)
+        counts = rg_row_counts[row_groups]
+        
+        read_ends = np.cumsum(counts)
+        owners = np.searchsorted(read_ends, indices, side='right')
+        shift = (rg_cum_rows[row_groups] - counts) - (read_ends - counts)
+        return indices + shift[owners]
+    
+    def _take_from_row_groups(
+        self,
+        parquet_file: pq.ParquetFile,
+        positions: np.ndarray,
+        columns: List[str]
+    ) -> pa.Table:
+        """
+        Take rows by file row position, reading only the row groups that hold them
+        
+        Row groups are streamed in batches so at most one batch is decoded
+        at a time. positions must be sorted ascending.
+        """
+        positions = np.asarray(positions, dtype=np.int64)
+        if len(positions) == 0:
+            return self._empty_table(parquet_file, columns)
+        
+        rg_row_counts, rg_cum_rows = self._row_group_index(parquet_file)
+        owners = np.searchsorted(rg_cum_rows, positions, side='right')
+        
+        # Re-base each position onto the row groups actually read
+        needed, owner_rank = np.unique(owners, return_inverse=True)
+        needed_starts = np.cumsum(rg_row_counts[needed]) - rg_row_counts[needed]
+        positions = positions - (rg_cum_rows[owners] - rg_row_counts[owners]) + needed_starts[owner_rank]
+        
+        batches = []
+        batch_start = 0
+        for batch in parquet_file.iter_batches(
+            batch_size=READ_BATCH_SIZE, row_groups=needed.tolist(), columns=columns
+        ):
+            batch_end = batch_start + batch.num_rows
+            lo, hi = np.searchsorted(positions, [batch_start, batch_end])
+            if hi > lo:
+                batches.append(batch.take(pa.array(positions[lo:hi] - batch_start)))
+            batch_start = batch_end
         
-        for i in range(len(schema)):
-            field = schema.field(i)
-            field_type = str(field.type)
+        return pa.Table.from_batches(batches, schema=self._empty_table(parquet_file, columns).schema)
+    
+    def _empty_table(
+        self,
+        parquet_file: pq.ParquetFile,
+        columns: Optional[List[str]] = None
+    ) -> pa.Table:
+        """Empty table with the file's schema, optionally projected to columns"""
+        table = self._arrow_schema(parquet_file).empty_table()
+        return table if columns is None else table.select(columns)
+    
+    def _to_pandas(self, table: pa.Table) -> pd.DataFrame:
+        """
+        Convert an Arrow Table to pandas without consolidating blocks
+        
+        Each column becomes its own block (zero-copy where the type allows)
+        and Arrow buffers are released as they are converted, so the table
+        must not be used afterwards.
+        """
+        return table.to_pandas(split_blocks=True, self_destruct=True)
+    
+    def _is_binary_or_nested(self, data_type: pa.DataType) -> bool:
+        """Check whether a column type holds raw bytes or nested values"""
+        return (
+            pa.types.is_binary(data_type) or pa.types.is_large_binary(data_type) or
+            pa.types.is_fixed_size_binary(data_type) or pa.types.is_nested(data_type)
+        )
+    
+    def _arrow_schema(self, parquet_file: pq.ParquetFile) -> pa.Schema:
+        """Arrow schema of a file, from the cache when available"""
+        cached = self._cached_by_file.get(parquet_file)
+        if cached is not None:
+            return cached.schema_arrow
+        return parquet_file.schema_arrow
+    
+    def _is_image_field(self, field: pa.Field) -> bool:
+        """Check for binary types or an image keyword in the column name"""
+        return (
+            pa.types.is_binary(field.type) or pa.types.is_large_binary(field.type) or
+            _IMAGE_NAME_PATTERN.search(field.name.lower()) is not None
+        )
+    
+    def _searchable_columns(self, schema: pa.Schema) -> List[str]:
+        """Columns worth text searching: no images, raw bytes or nested values"""
+        return [
+            field.name for field in schema
+            if not self._is_image_field(field) and not self._is_binary_or_nested(field.type)
+        ]
+    
+    def _search_mask(self, table: pa.Table, search_term: str) -> Optional[pa.ChunkedArray]:
+        """Build a row mask for a case-insensitive substring search in Arrow"""
+        term_chars = set(search_term.lower())
+        mask = None
+        for column in table.itercolumns():
+            column_type = column.type
+            if pa.types.is_string(column_type) or pa.types.is_large_string(column_type):
+                text = column
+            else:
+                # Skip casting columns whose text can't contain the term
+                if any(is_type(column_type) and not term_chars <= chars
+                       for is_type, chars in _TEXT_FORM_CHARS):
+                    continue
+                try:
+                    text = pc.cast(column, pa.string())
+                except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                    continue
             
-            # Determine if this is an image column
-            # Check for binary types or columns with 'image', 'img', 'picture', 'photo' in name
-            is_image = (
-                field_type in ['binary', 'large_binary'] or
-                any(keyword in field.name.lower() for keyword in ['image', 'img', 'picture', 'photo', 'thumbnail'])
-            )
+            matches = pc.match_substring(text, search_term, ignore_case=True)
+            mask = matches if mask is None else pc.or_kleene(mask, matches)
+        
+        return pc.fill_null(mask, False) if mask is not None else None
+    
+    def _filter_mask(
+        self,
+        column: pa.ChunkedArray,
+        operator: str,
+        value: Any
+    ) -> Optional[pa.ChunkedArray]:
+        """
+        Row mask for one filter on its column, or None if no row can match
+        
+        "contains" skips raw bytes and nested columns, as search does, and
+        matches other non-string columns on their text form. A value that
+        can't be compared with the column's type matches nothing.
+        """
+        try:
+            if operator == "contains":
+                if self._is_binary_or_nested(column.type):
+                    return None
+                if not (pa.types.is_string(column.type) or pa.types.is_large_string(column.type)):
+                    column = pc.cast(column, pa.string())
+            return _FILTER_KERNELS[operator](column, value)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+            return None
+    
+    def _row_group_may_match(
+        self,
+        row_group: pq.RowGroupMetaData,
+        filters: List[Tuple[Dict[str, Any], int]]
+    ) -> bool:
+        """Check (filter, column chunk index) pairs against a row group's min/max statistics"""
+        for filter_spec, column_index in filters:
+            stats = row_group.column(column_index).statistics
+            if stats is None or not stats.has_min_max:
+                continue
             
-            columns.append(ColumnSchema(
-                name=field.name,
-                type=field_type,
-                nullable=field.nullable,
-                is_image_column=is_image
-            ))
+            value = filter_spec["value"]
+            operator = filter_spec["operator"]
+            try:
+                if operator == "equals":
+                    values = value if isinstance(value, (list, tuple, set, frozenset)) else [value]
+                    if not any(stats.min <= v <= stats.max for v in values):
+                        return False
+                if operator == "gt" and not stats.max > value:
+                    return False
+                if operator == "gte" and not stats.max >= value:
+                    return False
+                if operator == "lt" and not stats.min < value:
+                    return False
+                if operator == "lte" and not stats.min <= value:
+                    return False
+            except TypeError:
+                # Statistics not comparable with the value; must read the group
+                continue
         
-        return columns
+        return True
     
-    def _extract_metadata(self, parquet_file: pq.ParquetFile) -> Dict[str, str]:
-        """Extract metadata from Parquet file"""
+    def _row_group_row_counts(self, metadata: pq.FileMetaData) -> np.ndarray:
+        """Row count of every row group, read once from the footer"""
+        return np.fromiter(
+            (metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)),
+            dtype=np.int64,
+            count=metadata.num_row_groups
+        )
+    
+    def _row_group_index(self, parquet_file: pq.ParquetFile) -> Tuple[np.ndarray, np.ndarray]:
+        """Row counts and cumulative row counts per row group, cached when available"""
+        cached = self._cached_by_file.get(parquet_file)
+        if cached is not None:
+            return cached.rg_row_counts, cached.rg_cum_rows
+        rg_row_counts = self._row_group_row_counts(parquet_file.metadata)
+        return rg_row_counts, np.cumsum(rg_row_counts)
+    
+    def _footer_column_stats(
+        self,
+        metadata: pq.FileMetaData,
+        column_name: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Combine a column's row group statistics into file-level null_count/min/max
+        
+        Returns None if the column is nested or any row group lacks the
+        statistics needed to answer exactly.
+        """
+        if metadata.num_row_groups == 0:
+            return None
+        
+        first_row_group = metadata.row_group(0)
+        column_index = next(
+            (i for i in range(first_row_group.num_columns)
+             if first_row_group.column(i).path_in_schema == column_name),
+            None
+        )
+        if column_index is None:
+            return None
+        
+        null_count = 0
+        minimum = maximum = None
+        for rg in range(metadata.num_row_groups):
+            column = metadata.row_group(rg).column(column_index)
+            stats = column.statistics
+            if stats is None or not stats.has_null_count:
+                return None
+            null_count += stats.null_count
+            
+            if stats.has_min_max:
+                minimum = stats.min if minimum is None else min(minimum, stats.min)
+                maximum = stats.max if maximum is None else max(maximum, stats.max)
+            elif stats.null_count != column.num_values:
+                # Values present but no min/max recorded
+                return None
+        
+        # Writers store a float min of +0.0 as -0.0 (and a max of -0.0 as
+        # +0.0); adding +0.0 turns either bound back into +0.0
+        if isinstance(minimum, float):
+            minimum += 0.0
+        if isinstance(maximum, float):
+            maximum += 0.0
+        
+        return {
+            "null_count": null_count,
+            "min": float("nan") if minimum is None else minimum,
+            "max": float("nan") if maximum is None else maximum,
+        }
+    
+    def _extract_schema(self, schema: pa.Schema) -> FileSchema:
+        """Extract schema information from the file's Arrow schema"""
+        # One pass over the fields, no per-index schema.field(i) lookups
+        fields = list(schema)
+        count = len(fields)
+        return FileSchema(
+            names=np.array(schema.names, dtype=object),
+            types=np.array([str(field.type) for field in fields], dtype=object),
+            nullables=np.fromiter((field.nullable for field in fields), dtype=bool, count=count),
+            is_image=np.fromiter(
+                (self._is_image_field(field) for field in fields), dtype=bool, count=count
+            )
+        )
+    
+    def _extract_metadata(self, schema: pa.Schema) -> Dict[str, str]:
+        """Extract metadata from the file's Arrow schema"""
         metadata = {}
         
         # Get schema metadata
-        if parquet_file.schema_arrow.metadata:
-            for key, value in parquet_file.schema_arrow.metadata.items():
+        if schema.metadata:
+            for key, value in schema.metadata.items():
                 metadata[key.decode('utf-8')] = value.decode('utf-8')
         
         return metadata
     
     def _get_compression(self, parquet_file: pq.ParquetFile) -> str:
-        """Get compression codec from Parquet file"""
+        """Get compression codec from Parquet file ("MIXED" if chunks differ)"""
         try:
-            # Get compression from first row group
-            if parquet_file.metadata.num_row_groups > 0:
-                row_group = parquet_file.metadata.row_group(0)
-                if row_group.num_columns > 0:
-                    column = row_group.column(0)
-                    return column.compression
-            return "UNCOMPRESSED"
+            # Collect the codec of every column chunk in one pass
+            metadata = parquet_file.metadata
+            compressions = set()
+            for rg in range(metadata.num_row_groups):
+                row_group = metadata.row_group(rg)
+                compressions.update(
+                    row_group.column(col).compression for col in range(metadata.num_columns)
+                )
+            if not compressions:
+                return "UNCOMPRESSED"
+            if len(compressions) == 1:
+                return next(iter(compressions))
+            return "MIXED"
         except:
             return "UNKNOWN"
     
+    def _cache_get(self, file_path: str) -> Optional[CachedFile]:
+        """Look up a cached file and mark it as most recently used"""
+        with self._cache_lock:
+            cached = self._file_cache.get(file_path)
+            if cached is not None:
+                self._file_cache.move_to_end(file_path)
+            return cached
+    
+    def _cache_put(self, file_path: str, cached: CachedFile):
+        """Store a parsed file, evicting the least recently used ones"""
+        with self._cache_lock:
+            # Entries reference their own handle, so they have to be dropped
+            # from the weak index explicitly to let the handle be collected
+            replaced = self._file_cache.pop(file_path, None)
+            if replaced is not None:
+                self._cached_by_file.pop(replaced.parquet_file, None)
+                self._drop_sort_orders(replaced)
+            
+            self._file_cache[file_path] = cached
+            self._cached_by_file[cached.parquet_file] = cached
+            while len(self._file_cache) > self._max_open_files:
+                _, evicted = self._file_cache.popitem(last=False)
+                self._cached_by_file.pop(evicted.parquet_file, None)
+                self._drop_sort_orders(evicted)
+    
+    def _drop_sort_orders(self, cached: CachedFile):
+        """Drop the sort orders of a file leaving the cache (lock held)"""
+        for key in [key for key in self._sort_orders if key[0] == id(cached)]:
+            self._sort_order_bytes -= self._sort_orders.pop(key).nbytes
+    
     def close_file(self, file_path: str):
         """Close and remove file from cache"""
-        if file_path in self._file_cache:
-            del self._file_cache[file_path]
+        with self._cache_lock:
+            cached = self._file_cache.pop(file_path, None)
+            if cached is not None:
+                self._cached_by_file.pop(cached.parquet_file, None)
+                self._drop_sort_orders(cached)
+        if cached is not None:
+            cached.parquet_file.close()
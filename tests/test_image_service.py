@@ -0,0 +1,110 @@
+"""
+Unit tests for ImageService
+"""
+
+import io
+
+import pytest
+from PIL import Image
+
+from src.image_service import ImageService, Thumbnail
+
+
+def _encode(size=(64, 32), format="PNG", mode="RGB", color=(200, 30, 30)):
+    """Encode a solid test image"""
+    buffer = io.BytesIO()
+    Image.new(mode, size, color).save(buffer, format=format)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def service():
+    return ImageService()
+
+
+class TestThumbnailCache:
+    """get_thumbnail caches small encoded records, not decoded images"""
+
+    def test_record_fields(self, service):
+        thumbnail = service.get_thumbnail(_encode((800, 400)), 100)
+
+        assert isinstance(thumbnail, Thumbnail)
+        assert thumbnail.format == "PNG"
+        assert thumbnail.original_size == (800, 400)
+        assert thumbnail.mode == "RGB"
+        assert thumbnail.webp_bytes[:4] == b"RIFF" and thumbnail.webp_bytes[8:12] == b"WEBP"
+        assert Image.open(io.BytesIO(thumbnail.webp_bytes)).size == (100, 50)
+
+    def test_cache_hit_returns_same_record(self, service):
+        data = _encode()
+
+        first = service.get_thumbnail(data, 100)
+        second = service.get_thumbnail(bytearray(data), 100)
+
+        assert second is first
+        assert service.thumbnail_webp_bytes(memoryview(data), 100) is first.webp_bytes
+
+    def test_sizes_cached_separately(self, service):
+        data = _encode((400, 400))
+
+        small = service.get_thumbnail(data, 50)
+        large = service.get_thumbnail(data, 200)
+
+        assert small is not large
+        assert Image.open(io.BytesIO(small.webp_bytes)).size == (50, 50)
+        assert Image.open(io.BytesIO(large.webp_bytes)).size == (200, 200)
+
+    def test_least_recently_used_evicted(self):
+        service = ImageService(cache_size=2)
+        red, green, blue = (_encode(color=color) for color in [(255, 0, 0), (0, 255, 0), (0, 0, 255)])
+
+        red_thumbnail = service.get_thumbnail(red, 100)
+        green_thumbnail = service.get_thumbnail(green, 100)
+        service.get_thumbnail(red, 100)
+        service.get_thumbnail(blue, 100)
+
+        assert len(service._thumbnail_cache) == 2
+        assert service.get_thumbnail(red, 100) is red_thumbnail
+        assert service.get_thumbnail(green, 100) is not green_thumbnail
+
+    def test_undecodable_data_not_cached(self, service):
+        assert service.get_thumbnail(b"not an image", 100) is None
+        assert service.thumbnail_webp_bytes(b"not an image", 100) is None
+        assert not service._thumbnail_cache
+
+
+class TestDetectImageFormat:
+    """Formats are sniffed from magic bytes, with PIL as the fallback"""
+
+    @pytest.mark.parametrize("format", ["PNG", "JPEG", "GIF", "BMP", "TIFF", "WEBP"])
+    def test_magic_bytes(self, service, format):
+        assert service.detect_image_format(_encode(format=format)) == format
+
+    def test_memoryview_input(self, service):
+        assert service.detect_image_format(memoryview(_encode(format="JPEG"))) == "JPEG"
+
+    def test_falls_back_to_pil(self, service):
+        assert service.detect_image_format(_encode((32, 32), format="ICO")) == "ICO"
+
+    @pytest.mark.parametrize("data", [b"", b"RIFF", b"not an image at all"])
+    def test_unknown(self, service, data):
+        assert service.detect_image_format(data) == "UNKNOWN"
+
+
+class TestExtractBytes:
+    """extract_bytes pulls encoded bytes out of Parquet cell values"""
+
+    @pytest.mark.parametrize("cell", [b"\x89PNG", bytearray(b"\x89PNG"), memoryview(b"\x89PNG")])
+    def test_buffers_passed_through(self, service, cell):
+        assert service.extract_bytes(cell) is cell
+
+    def test_huggingface_dict(self, service):
+        data = b"\xff\xd8\xff"
+
+        assert service.extract_bytes({"bytes": data, "path": "a.jpg"}) is data
+
+    @pytest.mark.parametrize("cell", [
+        None, b"", "a.jpg", 42, {"bytes": None, "path": "a.jpg"}, {"bytes": b""}, {"path": "a.jpg"},
+    ])
+    def test_no_image_data(self, service, cell):
+        assert service.extract_bytes(cell) is None
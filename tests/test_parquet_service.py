@@ -0,0 +1,337 @@
+"""
+Unit tests for ParquetService
+"""
+
+import decimal
+import math
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+import pytest
+from hypothesis import given, settings, strategies as st
+
+from src.parquet_service import ParquetService
+
+
+def _ungated_search_mask(table: pa.Table, search_term: str) -> pa.ChunkedArray:
+    """Reference search: cast every non-string column to text and match it"""
+    mask = None
+    for column in table.itercolumns():
+        if not (pa.types.is_string(column.type) or pa.types.is_large_string(column.type)):
+            column = pc.cast(column, pa.string())
+        matches = pc.match_substring(column, search_term, ignore_case=True)
+        mask = matches if mask is None else pc.or_kleene(mask, matches)
+    return pc.fill_null(mask, False)
+
+
+# Numbers in every text form Arrow produces: signs, exponents, nan/inf
+MIXED_TYPE_TABLE = pa.table({
+    "i64": pa.array([-12, 0, 7, None, 2**40, -(2**62), 105], type=pa.int64()),
+    "u8": pa.array([0, 1, 255, 10, None, 42, 99], type=pa.uint8()),
+    "f64": pa.array([1.5e20, -0.25, float("nan"), float("inf"), float("-inf"), None, 3e-7]),
+    "f32": pa.array([1.0, -2.5, 1e10, None, 0.1, 123456.0, -1e-3], type=pa.float32()),
+    "dec": pa.array(
+        [decimal.Decimal(v) if v is not None else None
+         for v in ["1.500", "-0.001", "12345.678", None, "0.000", "99.990", "-7.100"]],
+        type=pa.decimal128(10, 3)
+    ),
+    "flag": pa.array([True, False, None, True, False, True, None]),
+    "text": pa.array(["Alpha", "beta-1", "1.5e+20", None, "INF", "x", "true"]),
+})
+
+
+@pytest.fixture
+def service():
+    return ParquetService()
+
+
+@pytest.fixture
+def sort_file(tmp_path):
+    """Multi-row-group file with ties and nulls in the sort columns"""
+    rng = np.random.default_rng(7)
+    n = 1000
+    ints = rng.integers(0, 20, n).astype(object)
+    ints[rng.random(n) < 0.1] = None
+    words = np.array([f"w{v}" for v in rng.integers(0, 30, n)], dtype=object)
+    words[rng.random(n) < 0.1] = None
+    table = pa.table({
+        "id": np.arange(n),
+        "num": pa.array(ints.tolist(), type=pa.int64()),
+        "word": pa.array(words.tolist(), type=pa.string()),
+    })
+    path = tmp_path / "sort.parquet"
+    pq.write_table(table, path, row_group_size=97)
+    return str(path)
+
+
+@pytest.fixture
+def filter_file(tmp_path):
+    """Small file with numeric, text, binary and nested columns"""
+    table = pa.table({
+        "id": [1, 2, 3, 4, 5, 6, None, 8],
+        "name": ["apple", "banana", "cherry", None, "apricot", "grape", "fig", "plum"],
+        "raw": [b"\xe4ab", b"ab", None, b"xyz", b"\x89PNG", b"a", b"b", b"c"],
+        "meta": [{"k": i} for i in range(8)],
+    })
+    path = tmp_path / "filter.parquet"
+    pq.write_table(table, path, row_group_size=3)
+    return str(path)
+
+
+class TestSearchMask:
+    """Skipping casts by character set must not change search results"""
+
+    @pytest.mark.property
+    @settings(max_examples=400, deadline=None)
+    @given(st.text(alphabet="0123456789-+.eEinfaINFtruesFALSxz %", min_size=1, max_size=6))
+    def test_gated_mask_matches_ungated(self, search_term):
+        service = ParquetService()
+        gated = service._search_mask(MIXED_TYPE_TABLE, search_term)
+        expected = _ungated_search_mask(MIXED_TYPE_TABLE, search_term)
+        assert gated.to_pylist() == expected.to_pylist()
+
+    @pytest.mark.parametrize("search_term", ["e+20", "5.", "NaN", "-inf", "FALSE", "255", "apple"])
+    def test_partial_number_forms(self, service, search_term):
+        gated = service._search_mask(MIXED_TYPE_TABLE, search_term)
+        expected = _ungated_search_mask(MIXED_TYPE_TABLE, search_term)
+        assert gated.to_pylist() == expected.to_pylist()
+
+
+class TestSearchRows:
+    """search_rows on whole files"""
+
+    def test_empty_file(self, service, tmp_path):
+        path = tmp_path / "empty.parquet"
+        pq.write_table(pa.table({"id": pa.array([], pa.int64()), "name": pa.array([], pa.string())}), path)
+        parquet_file, _ = service.parse_file(str(path))
+
+        result = service.search_rows(parquet_file, "a")
+
+        assert len(result) == 0
+        assert list(result.columns) == ["id", "name"]
+
+
+class TestColumnStats:
+    """Footer-derived column stats match pandas on the decoded column"""
+
+    @pytest.fixture
+    def stats_file(self, tmp_path):
+        table = pa.table({
+            "zero_min": [0.0, 1.0, 2.0, None, 0.5, 3.0],
+            "neg": [-4.5, -0.0, -1.0, -2.0, None, None],
+            "ints": pa.array([7, -3, 12, None, 0, 5], type=pa.int32()),
+            "flag": [True, False, None, True, True, False],
+            "all_null": pa.array([None] * 6, type=pa.float64()),
+        })
+        path = tmp_path / "stats.parquet"
+        pq.write_table(table, path, row_group_size=2)
+        return str(path)
+
+    @pytest.mark.parametrize("column", ["zero_min", "neg", "ints", "flag"])
+    def test_matches_pandas(self, service, stats_file, column):
+        parquet_file, _ = service.parse_file(stats_file)
+        series = pq.read_table(stats_file).to_pandas()[column]
+
+        stats = service.get_column_stats(parquet_file, column)
+
+        assert stats["null_count"] == series.isna().sum()
+        assert stats["min"] == series.min()
+        assert stats["max"] == series.max()
+
+    def test_zero_bounds_are_positive(self, service, stats_file):
+        parquet_file, _ = service.parse_file(stats_file)
+
+        stats = service.get_column_stats(parquet_file, "zero_min")
+
+        assert stats["min"] == 0.0
+        assert math.copysign(1.0, stats["min"]) == 1.0
+
+    def test_all_null_column(self, service, stats_file):
+        parquet_file, _ = service.parse_file(stats_file)
+
+        stats = service.get_column_stats(parquet_file, "all_null")
+
+        assert stats["null_count"] == 6
+        assert math.isnan(stats["min"]) and math.isnan(stats["max"])
+
+
+class TestSampling:
+    """get_sample_table draws exactly sample_size distinct rows over the whole file"""
+
+    @pytest.fixture
+    def sample_file(self, tmp_path):
+        n = 5000
+        table = pa.table({"id": np.arange(n), "label": [f"row{i}" for i in range(n)]})
+        path = tmp_path / "sample.parquet"
+        pq.write_table(table, path, row_group_size=333)
+        return str(path)
+
+    @pytest.mark.parametrize("sample_size", [1, 100, 4999])
+    def test_exact_size_distinct_rows_in_file_order(self, service, sample_file, sample_size):
+        parquet_file, _ = service.parse_file(sample_file)
+
+        sample = service.get_sample_table(parquet_file, sample_size=sample_size, random_seed=3)
+
+        ids = sample.column("id").to_numpy()
+        assert sample.num_rows == sample_size
+        assert len(np.unique(ids)) == sample_size
+        assert (np.diff(ids) > 0).all()
+        assert sample.column("label").to_pylist() == [f"row{i}" for i in ids]
+
+    def test_seed_reproduces_sample(self, service, sample_file):
+        parquet_file, _ = service.parse_file(sample_file)
+
+        first = service.get_sample_table(parquet_file, sample_size=250, random_seed=11)
+        second = service.get_sample_table(parquet_file, sample_size=250, random_seed=11)
+
+        assert first.equals(second)
+
+    def test_small_file_returned_whole(self, service, sample_file):
+        parquet_file, _ = service.parse_file(sample_file)
+
+        sample = service.get_sample_table(parquet_file, sample_size=10000)
+
+        assert sample.column("id").to_pylist() == list(range(5000))
+
+    def test_slice_sample_page_as_dataframe(self, service, sample_file):
+        parquet_file, _ = service.parse_file(sample_file)
+        sample = service.get_sample_table(parquet_file, sample_size=250, random_seed=5)
+
+        page = service.slice_sample(sample, 240, 20)
+
+        assert isinstance(page, pd.DataFrame)
+        assert list(page.index) == list(range(240, 250))
+        assert page["id"].tolist() == sample.column("id").to_pylist()[240:]
+        assert sample.num_rows == 250
+
+
+class TestSortedPages:
+    """Sorting applies to the whole file before pagination"""
+
+    @pytest.mark.parametrize("sort_column", ["num", "word"])
+    @pytest.mark.parametrize("ascending", [True, False])
+    @pytest.mark.parametrize("offset,limit", [(0, 50), (90, 25), (480, 100), (980, 50)])
+    def test_matches_pandas_stable_sort(self, service, sort_file, sort_column, ascending, offset, limit):
+        parquet_file, _ = service.parse_file(sort_file)
+        expected = pq.read_table(sort_file).to_pandas().sort_values(
+            sort_column, ascending=ascending, kind="stable", na_position="last"
+        ).iloc[offset:offset + limit]
+
+        page = service.get_rows(parquet_file, offset, limit, sort_column, ascending)
+
+        assert page.index.tolist() == expected.index.tolist()
+        assert page["id"].tolist() == expected["id"].tolist()
+
+    def test_sort_column_outside_projection(self, service, sort_file):
+        parquet_file, _ = service.parse_file(sort_file)
+        expected = pq.read_table(sort_file).to_pandas().sort_values(
+            "num", kind="stable", na_position="last"
+        ).iloc[100:130]
+
+        page = service.get_rows(parquet_file, 100, 30, "num", True, columns=["id"])
+
+        assert list(page.columns) == ["id"]
+        assert page["id"].tolist() == expected["id"].tolist()
+
+    def test_sort_orders_are_bounded_by_bytes(self, sort_file):
+        # Room for two orders of 1000 uint32 positions
+        service = ParquetService(max_sort_order_bytes=2 * 1000 * 4)
+        parquet_file, _ = service.parse_file(sort_file)
+        for sort_column in ["id", "num", "word"]:
+            for ascending in [True, False]:
+                service.get_rows(parquet_file, 0, 10, sort_column, ascending)
+
+        assert [key[1:] for key in service._sort_orders] == [("word", True), ("word", False)]
+        assert all(order.dtype == np.uint32 for order in service._sort_orders.values())
+        assert service._sort_order_bytes == 2 * 1000 * 4
+
+    def test_sort_orders_dropped_with_file(self, service, sort_file):
+        parquet_file, _ = service.parse_file(sort_file)
+        service.get_rows(parquet_file, 0, 10, "num", True)
+
+        service.close_file(sort_file)
+
+        assert not service._sort_orders
+        assert service._sort_order_bytes == 0
+
+
+class TestFilterRows:
+    """filter_rows matches the equivalent pandas masks and never raises on bad values"""
+
+    @pytest.mark.parametrize("filters,pandas_mask", [
+        ([{"column": "id", "operator": "gt", "value": 4}], lambda df: df["id"] > 4),
+        ([{"column": "id", "operator": "lte", "value": 2}], lambda df: df["id"] <= 2),
+        ([{"column": "id", "operator": "equals", "value": [1, 5, 8]}], lambda df: df["id"].isin([1, 5, 8])),
+        ([{"column": "name", "operator": "contains", "value": "ap"}],
+         lambda df: df["name"].str.contains("ap", regex=False, na=False)),
+        ([{"column": "id", "operator": "contains", "value": "8"}], lambda df: df["id"] == 8),
+        ([{"column": "name", "operator": "contains", "value": "a"},
+          {"column": "id", "operator": "gte", "value": 3}],
+         lambda df: df["name"].str.contains("a", regex=False, na=False) & (df["id"] >= 3)),
+        ([{"column": "missing", "operator": "equals", "value": 1}], lambda df: pd.Series(True, index=df.index)),
+    ])
+    def test_matches_pandas(self, service, filter_file, filters, pandas_mask):
+        parquet_file, _ = service.parse_file(filter_file)
+        df = pq.read_table(filter_file).to_pandas()
+        expected = df[pandas_mask(df).fillna(False).astype(bool)]
+
+        result = service.filter_rows(parquet_file, filters)
+
+        assert result.index.tolist() == expected.index.tolist()
+        assert result["name"].tolist() == expected["name"].tolist()
+
+    @pytest.mark.parametrize("filters", [
+        [{"column": "raw", "operator": "contains", "value": "ab"}],
+        [{"column": "meta", "operator": "contains", "value": "k"}],
+        [{"column": "id", "operator": "equals", "value": "5"}],
+        [{"column": "id", "operator": "equals", "value": [1, "2"]}],
+        [{"column": "id", "operator": "gt", "value": "x"}],
+    ])
+    def test_uncomparable_filters_match_nothing(self, service, filter_file, filters):
+        parquet_file, _ = service.parse_file(filter_file)
+
+        result = service.filter_rows(parquet_file, filters)
+
+        assert len(result) == 0
+        assert list(result.columns) == ["id", "name", "raw", "meta"]
+
+    def test_only_empty_row_group_left(self, service, tmp_path):
+        path = tmp_path / "empty_group.parquet"
+        schema = pa.schema([("id", pa.int64()), ("name", pa.string())])
+        with pq.ParquetWriter(path, schema) as writer:
+            writer.write_table(pa.table({"id": [1, 2, 3, 4, 5], "name": list("abcde")}, schema=schema))
+            writer.write_table(schema.empty_table())
+        parquet_file, _ = service.parse_file(str(path))
+
+        result = service.filter_rows(parquet_file, [{"column": "id", "operator": "gt", "value": 100}])
+
+        assert len(result) == 0
+        assert list(result.columns) == ["id", "name"]
+
+    def test_projection(self, service, filter_file):
+        parquet_file, _ = service.parse_file(filter_file)
+
+        result = service.filter_rows(
+            parquet_file, [{"column": "id", "operator": "gte", "value": 5}], columns=["name"]
+        )
+
+        assert list(result.columns) == ["name"]
+        assert result.index.tolist() == [4, 5, 7]
+        assert result["name"].tolist() == ["apricot", "grape", "plum"]
+
+    def test_statistics_skip_row_groups(self, service, filter_file, monkeypatch):
+        parquet_file, _ = service.parse_file(filter_file)
+        read_row_groups = parquet_file.read_row_groups
+        requested = []
+        monkeypatch.setattr(
+            parquet_file, "read_row_groups",
+            lambda row_groups, **kwargs: requested.append(list(row_groups)) or read_row_groups(row_groups, **kwargs)
+        )
+
+        result = service.filter_rows(parquet_file, [{"column": "id", "operator": "gte", "value": 7}])
+
+        assert requested == [[2]]
+        assert result.index.tolist() == [7]